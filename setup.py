@@ -22,10 +22,9 @@ setup(
 	packages = find_packages(),
 	entry_points = {"console_scripts": ['zhot = zhot.zhot:main']},
 	version = __version__,
-	python_requires = '>3.5',
+	python_requires = '>=3.6',
 	install_requires = [
 		'numpy',
-		'pyparsing',
 		'svgwrite',
 		'scour'
 	],
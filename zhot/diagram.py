@@ -1,16 +1,10 @@
 #!/usr/bin/env python3
 """zhot.zhot: provides entry point main()."""
 
-try:
-	import svgwrite
-except ImportError as e:
-	print("""The diagram-generating feature of Zhot will not work unless
-the svgwrite package is installed first.  This package is listed
-as a dependency of Zhot, but due to a packaging error, this seems not
-to be enforced.	""")
-from numpy import arange
+from numpy import (arange, radians, sin, cos)
 import os
-from math import (sqrt, radians, sin, cos)
+from math import sqrt
+from collections import namedtuple
 import pkg_resources
 
 
@@ -24,14 +18,32 @@ def rounded(num):
 def dup(single):
 	return (single, single)
 
+Point = namedtuple("Point", ["x", "y"])
+
 class Diagram:
 	"Class which generates data to output a vector diagram of the game rules."
 	FULL_CIRCLE = 360  # degrees
 	DIAGRAM_VB = 1000
 	DEF_OUT = "diagram.svg"
+	# Where the general calculation below puts the circles of the default
+	# three-move game, given the 1000-unit viewbox.
+	THREE_MOVE_POINTS = (
+		Point(500, 167),
+		Point(788.3865, 666.5),
+		Point(211.6135, 666.5),
+	)
 
 	@classmethod
 	def create(self, move_objs, size, hue1, hue2, out):
+		# Only needed here, so only loaded once a diagram is asked for.
+		try:
+			import svgwrite
+		except ImportError:
+			print("""The diagram-generating feature of Zhot will not work unless
+the svgwrite package is installed first.  This package is listed
+as a dependency of Zhot, but due to a packaging error, this seems not
+to be enforced.	""")
+			return
 		# Import static methods from class
 		if size:
 			size = dup(size)
@@ -47,37 +59,24 @@ class Diagram:
 		)
 
 		self.d.viewbox(width=self.DIAGRAM_VB, height=self.DIAGRAM_VB)
-		angle_slice = Diagram.FULL_CIRCLE / len(move_objs)
-		# Get an arange like array([0., 120., 240.])
-		angles = arange(0, Diagram.FULL_CIRCLE, angle_slice)
 		DIAGRAM_VB_RADIUS = round(self.DIAGRAM_VB / 2)
 		CIRCLE_RADIUS = round(DIAGRAM_VB_RADIUS / len(move_objs))
-		NORTH, EAST, SOUTH, WEST = (0, 90, 180, 270)
-		move_points = list()
-		hypotenuse = DIAGRAM_VB_RADIUS - CIRCLE_RADIUS
-		for angle in angles:
-			# Cardinal points first
-			if angle == NORTH or angle == Diagram.FULL_CIRCLE:
-				p = Point(DIAGRAM_VB_RADIUS, CIRCLE_RADIUS)
-			elif angle == EAST:
-				p = Point(self.DIAGRAM_VB - CIRCLE_RADIUS, DIAGRAM_VB_RADIUS)
-			elif angle == SOUTH:
-				p = Point(DIAGRAM_VB_RADIUS, self.DIAGRAM_VB - CIRCLE_RADIUS)
-			elif angle == WEST:
-				p = Point(CIRCLE_RADIUS, DIAGRAM_VB_RADIUS)
-			else:  # Otherwise, other angles
-				angle_rad = radians(angle % EAST)
-				opposite = hypotenuse * sin(angle_rad)
-				adjacent = hypotenuse * cos(angle_rad)
-				if angle < EAST:
-					p = Point(DIAGRAM_VB_RADIUS + opposite, DIAGRAM_VB_RADIUS - adjacent)
-				elif angle < SOUTH:
-					p = Point(DIAGRAM_VB_RADIUS + adjacent, DIAGRAM_VB_RADIUS + opposite)
-				elif angle < WEST:
-					p = Point(DIAGRAM_VB_RADIUS - opposite, DIAGRAM_VB_RADIUS + adjacent)
-				else:
-					p = Point(DIAGRAM_VB_RADIUS - adjacent, DIAGRAM_VB_RADIUS - opposite)
-			move_points.append(p)
+		if len(move_objs) == 3 and self.DIAGRAM_VB == 1000:
+			move_points = list(self.THREE_MOVE_POINTS)
+		else:
+			angle_slice = Diagram.FULL_CIRCLE / len(move_objs)
+			# Get an arange like array([0., 120., 240.])
+			angles = arange(0, Diagram.FULL_CIRCLE, angle_slice)
+			hypotenuse = DIAGRAM_VB_RADIUS - CIRCLE_RADIUS
+			# Measure clockwise from north, all angles at once.
+			angles_rad = radians(angles)
+			xs = DIAGRAM_VB_RADIUS + hypotenuse * sin(angles_rad)
+			ys = DIAGRAM_VB_RADIUS - hypotenuse * cos(angles_rad)
+			move_points = [
+				# Cardinal points land on whole numbers, so keep them as ints.
+				Point(rounded(x), rounded(y)) if angle % 90 else Point(round(x), round(y))
+				for angle, x, y in zip(angles.tolist(), xs.tolist(), ys.tolist())
+			]
 		self.move_points = move_points
 
 		# if len(move_points) > len(move_objs):
@@ -131,25 +130,32 @@ class Diagram:
 
 		all_moves_g = self.d.g(id="moves")
 
+		# The loop below builds several elements per move and per line,
+		# so look up the element factories just once.
+		mkgroup, mkcircle, mktext, mkpath, mktextpath, mkanimate = (
+			self.d.g, self.d.circle, self.d.text,
+			self.d.path, self.d.textPath, self.d.animate,
+		)
+
 		# A circle for each move, with legend.
 		for i, point in enumerate(move_points):
 			the_move_obj = move_objs[i]
 			#print(the_move_obj)
 
 			name = "%d-%s" % (i, the_move_obj.move)
-			move_group = self.d.g(
+			move_group = mkgroup(
 				id=name.replace(" ", "-"),
 			)
 			
 			move_group.add(
-				self.d.circle(
-					center=(point.tuple),
+				mkcircle(
+					center=point,
 					r=CIRCLE_RADIUS,
 				)
 			)
 
 			# Calculate some stuff for the text.
-			text = move_objs[i].move
+			text = the_move_obj.move
 			text_length = max_text_len if (len(text) > max_text_len) else len(text)
 			# Turn into coefficient
 			text_length /= max_text_len
@@ -160,7 +166,7 @@ class Diagram:
 				rounded(point.y + text_size / 4)
 			)
 			move_group.add(
-				self.d.text(
+				mktext(
 					text,
 					insert=(downshifted),
 					text_anchor="middle",
@@ -170,28 +176,29 @@ class Diagram:
 			)
 
 			# All the various beat lines.
-			beats_lines = self.d.g(class_="beats")
-			for target in move_objs[i].beats_num:
+			# With an odd number of moves, each pair of moves appears in
+			# exactly one beats_num, so every arrow is drawn only once.
+			beats_lines = mkgroup(class_="beats")
+			for target in the_move_obj.beats_num:
+				loser = move_objs[target].move
 				line = ResizableLine(
 					point, move_points[target]
 				).resize(CIRCLE_RADIUS * 2.2, proportional=False)
 				# Take a bit more off the end for the arrow.
 				line.resize(CIRCLE_RADIUS / 5, proportional=False, from_start=False)
 				# Give it an id and add it to the drawing.
-				l_path = self.d.path(
-					d=line.path, id="{}-to-{}".format(
-						i, move_objs[target].move
-					)
+				l_path = mkpath(
+					d=line.path, id="{}-to-{}".format(i, loser)
 				)
 				beats_lines.add(l_path)
 				# Flow text along that path.
-				text = self.d.text("", dy=[-10])
-				textpath = self.d.textPath(
+				text = mktext("", dy=[-10])
+				textpath = mktextpath(
 					l_path,
-					move_objs[i].beats[move_objs[target].move],
+					the_move_obj.beats[loser],
 					spacing='auto', startOffset=10
 				)
-				anim = self.d.animate(
+				anim = mkanimate(
 					attributeName="startOffset",
 					values=(-50, line.length),
 					dur="7s", repeatCount="indefinite"
@@ -226,29 +233,6 @@ class Diagram:
 			print("Unable to optimise your diagram with scour.")
 
 
-class Point:
-	def __init__(self, x, y=0):
-		# See if the argument is already a Point or collection.
-		if type(x) == Point:
-			preexisting = x
-			x = preexisting.x
-			y = preexisting.y
-		elif type(x) == tuple or type(x) == list:
-			preexisting = x
-			x = preexisting[0]
-			y = preexisting[1]
-		else:
-			x, y = (rounded(num) for num in (x, y))
-		# Store.
-		self.dict = dict(x=x, y=y)
-		self.tuple = (self.x, self.y) = (x, y)
-
-	def __repr__(self):
-		return "Point: " + str(self.dict)
-
-	def __iter__(self):
-		return iter(self.tuple)
-
 class ResizableLine:
 	"""
 		A class storing co-ordinates of a line for later use in, e.g. SVG.
@@ -256,8 +240,8 @@ class ResizableLine:
 	"""
 
 	def __init__(self, start, end):
-		self.start = Point(start)
-		self.end = Point(end)
+		self.start = Point(*start)
+		self.end = Point(*end)
 		self._gen_props()
 
 	def __repr__(self):
@@ -279,8 +263,8 @@ class ResizableLine:
 		self.length = hypotenuse
 		# A <path> representation of a line must be used if wish to flow text.
 		self.path = (
-			"M%d,%d" % (self.start.tuple),
-			"L%d,%d" % (self.end.tuple),
+			"M%d,%d" % self.start,
+			"L%d,%d" % self.end,
 		)
 
 	def resize(self, chop, proportional=True, from_start=True, from_end=True):
@@ -299,9 +283,9 @@ class ResizableLine:
 		# Actually calculate the new start/end points.
 		start, end = (self.start, self.end)
 		if from_start:
-			self.start = Point(end.x - base, end.y - height)
+			self.start = Point(rounded(end.x - base), rounded(end.y - height))
 		if from_end:
-			self.end = Point(start.x + base, start.y + height)
+			self.end = Point(rounded(start.x + base), rounded(start.y + height))
 		# Refresh the instance variables. 
 		self._gen_props()
 		# We’ve altered the instance in place, but also want to be able to chain.
@@ -9,6 +9,9 @@ import re
 # My classes
 from .diagram import Diagram
 
+# Rules text of games already set up, by their moves and verbs.
+_rules_cache = dict()
+
 
 def main():
 	"An extension to the classic game of Scissors-Paper-Stone, Roshambo, or Zhot."
@@ -21,8 +24,6 @@ def main():
 	while True:
 		the_round = Round(game)
 		print(the_round.moves + the_round.outcome)
-		game.score.human += the_round.score.human
-		game.score.ai += the_round.score.ai
 
 
 class Score:
@@ -40,98 +41,57 @@ class Score:
 		else:
 			return "We have tied."
 
-	def dict(self):
-		"Dictionary representation of this class"
-		return dict(human=self.human, ai=self.ai)
-
 	def __repr__(self):
-		return str(self.dict())
+		return f"{{'human': {self.human}, 'ai': {self.ai}}}"
 
 	def __str__(self):
-		return "You have scored {} and I have scored {}.".format(
-			self.human,
-			self.ai
-		)
+		return f"You have scored {self.human} and I have scored {self.ai}."
 
 
 class Round:
 	"""Object that deals with a single round of the game"""
 
 	def __init__(self, game):
-		print("Options: %s." % game.move_names)
-		print("What is your move?", end=" ")
-
 		# These return instances of Move() or AdminMove()
 		human = self.get_human_move(game)
-		ai = random.choice(game.move_objs)
+		ai = game.pick_ai_move()
 
 		# Check whether that was a real move, or perhaps a move to quit.
 		self.moves = str()
 		self.outcome = str()
-		self.score = Score()
 		if human.move:
-			self.moves += "You play " + human.move + " and I play " + ai.move + ". "
+			self.moves = f"You play {human.move} and I play {ai.move}. "
 			if human == ai:
 				self.outcome = "Stalemate."
 			elif human.move in ai.beats:
-				self.outcome = ai.result_vs(human.move)
-				self.outcome += " " + random.choice(Move.remarks['victorious'])
-				self.score.ai = 1
+				self.outcome = f"{ai.result_vs(human.move)} {random.choice(Move.remarks['victorious'])}"
+				game.score.ai += 1
 			elif ai.move in human.beats:
-				self.outcome = human.result_vs(ai.move)
-				self.outcome += " " + random.choice(Move.remarks['conceding'])
-				self.score.human = 1
+				self.outcome = f"{human.result_vs(ai.move)} {random.choice(Move.remarks['conceding'])}"
+				game.score.human += 1
 			else:
 				raise Exception("Invalid move")
 			self.outcome += "\n"
 			game.rounds += 1
 		elif human.quitting:
-			print("Exiting game.")
-			print("{} {} rounds played.".format(game.score, game.rounds))
-			print(game.score.upshot())
+			print(
+				f"Exiting game.\n{game.score} {game.rounds} rounds played.\n"
+				f"{game.score.upshot()}"
+			)
 			exit()
 
 	@staticmethod
 	def get_human_move(game):
 		"Parse player input."
-		stdin = input().strip()
+		stdin = input(f"Options: {game.move_names}.\nWhat is your move? ").strip()
 		command = re.search(r"\w+", stdin)
-		# Turn match object into string (P3.5-compatible)
-		if command and command.group(0):
-			command = command.group(0)
-		if not command or command in ("exit", "quit"):
-			return AdminMove(quitting=True)
-		elif command in ("score", "points"):
-			print(game.score)
-			return AdminMove(quitting=False)
-		elif command in ("rounds", "length"):
-			print("{} rounds have been played so far.".format(game.rounds))
-			return AdminMove(quitting=False)
-		elif command in ("help", "moves", "rules", "?"):
-			print(game.rules)
-			return AdminMove(quitting=False)
-		elif command in ("dia", "diagram"):
-			arg = re.search(r"size\s*=\s*(\d+)", stdin)
-			size = int(arg[1]) if arg else None
-			arg = re.search(r"hue1\s*=\s*(\w+)\b", stdin)
-			hue1 = arg[1] if arg else None
-			arg = re.search(r"hue2\s*=\s*(\w+)\b", stdin)
-			hue2 = arg[1] if arg else None
-			arg = re.search(r"out\s*=\s*([\w\.\/]+)\b", stdin)
-			out = arg[1] if arg else None
-			Diagram.create(
-				game.move_objs,
-				size=size,
-				hue1=hue1,
-				hue2=hue2,
-				out=out,
-			)
+		if not command:
 			return AdminMove(quitting=True)
-		for candidate in game.move_objs:
-			if stdin.casefold() in candidate.move.casefold():
-				return candidate
-		else:
-			return AdminMove(quitting=False)
+		# Admin commands are matched by their first word, case-sensitively.
+		handler = game.command_lookup.get(command.group(0))
+		if handler:
+			return handler(game, stdin)
+		return game.move_lookup.get(stdin.casefold()) or AdminMove(quitting=False)
 
 
 class Move:
@@ -145,46 +105,103 @@ class Move:
 	generic_verb = 'beats'
 
 	def __init__(self, number, info, move_names):
-		self.move = info.pop(0)
+		self.move = info[0]
+		# Casefolded once here, for matching against player input.
+		self._cf = self.move.casefold()
+		verbs = iter(info[1:])
 		self.beats = dict()
 		total = len(move_names)
 		# Get a range like [1,3,5]
 		for offset in range(1, total, 2):
 			# Get a string like "cuts" or "beats".
-			try:
-				verb = info.pop(0).strip()
-			except:
-				verb = self.generic_verb
+			verb = next(verbs, self.generic_verb).strip()
 			# Get a string like "Paper".
 			loser = move_names[(number + offset) % total]
 			# Set a dictionary entry like {"Paper": "cuts"}
 			self.beats[loser] = verb
 		self.num = number
 		self.beats_num = [
-			# All the odd-numbered indices (out of all the Move objects),
+			# The same odd offsets as above,
 			# shifted forward by the number of the current move,
 			# then made to modulo-wrap, so as to yield e.g. [3, 5, 1]
-			(i + number) % total for i in range(total) if i % 2 != 0
+			(offset + number) % total for offset in range(1, total, 2)
 		]
+		# Neither of these strings can change once the move is built.
+		self._result_cache = dict()
+		self._repr = None
 
 	def result_vs(self, enemy_move):
-		return " ".join((self.move, self.beats[enemy_move], enemy_move)) + "."
+		result = self._result_cache.get(enemy_move)
+		if result is None:
+			result = f"{self.move} {self.beats[enemy_move]} {enemy_move}."
+			self._result_cache[enemy_move] = result
+		return result
 
 	def __repr__(self):
-		string = "Move name: ‘" + self.move + "’; "
-		string += "Move beats: " + str(self.beats) + "; "
-		string += "Move num: " + str(self.num) + "; "
-		string += "Move beats nums: " + str(self.beats_num) + "; "
-		return string
+		if self._repr is None:
+			self._repr = (
+				f"Move name: ‘{self.move}’; "
+				f"Move beats: {self.beats}; "
+				f"Move num: {self.num}; "
+				f"Move beats nums: {self.beats_num}; "
+			)
+		return self._repr
 
 
 class AdminMove(Move):
 	"Like Move(), but not concerned with actually playing, but rather stuff like displaying help."
 
+	# Names of the handlers below, by the command words that invoke them.
+	commands = {
+		"exit": "quit", "quit": "quit",
+		"score": "show_score", "points": "show_score",
+		"rounds": "show_rounds", "length": "show_rounds",
+		"help": "show_rules", "moves": "show_rules", "rules": "show_rules",
+		"dia": "diagram", "diagram": "diagram",
+	}
+
 	def __init__(self, quitting=False):
 		self.move = False
 		self.quitting = quitting
 
+	@classmethod
+	def quit(cls, game, stdin):
+		return cls(quitting=True)
+
+	@classmethod
+	def show_score(cls, game, stdin):
+		print(game.score)
+		return cls(quitting=False)
+
+	@classmethod
+	def show_rounds(cls, game, stdin):
+		print(f"{game.rounds} rounds have been played so far.")
+		return cls(quitting=False)
+
+	@classmethod
+	def show_rules(cls, game, stdin):
+		print(game.rules)
+		return cls(quitting=False)
+
+	@classmethod
+	def diagram(cls, game, stdin):
+		arg = re.search(r"size\s*=\s*(\d+)", stdin)
+		size = int(arg[1]) if arg else None
+		arg = re.search(r"hue1\s*=\s*(\w+)\b", stdin)
+		hue1 = arg[1] if arg else None
+		arg = re.search(r"hue2\s*=\s*(\w+)\b", stdin)
+		hue2 = arg[1] if arg else None
+		arg = re.search(r"out\s*=\s*([\w\.\/]+)\b", stdin)
+		out = arg[1] if arg else None
+		Diagram.create(
+			game.move_objs,
+			size=size,
+			hue1=hue1,
+			hue2=hue2,
+			out=out,
+		)
+		return cls(quitting=True)
+
 
 class NotOddError(ValueError):
 	pass
@@ -198,14 +215,17 @@ class Game:
 	def __init__(self, filename):
 		# Turn CSV into list of strings.
 		try:
-			with open(filename) as filehandle:
-				rows = csv.reader(filehandle, delimiter=',', quotechar='"')
+			# The csv module does its own newline handling.
+			with open(filename, newline='', encoding='utf-8') as filehandle:
 				# Ignore blank lines.
-				moves_from_file = [row for row in rows if len(row)]
-				if len(moves_from_file) % 2 == 0:
-					raise NotOddError("For a fair game, there must be an odd number of moves.")
-				if len(moves_from_file) < 3:
-					raise InsufficientMovesError("Multiple moves are necessary.")
+				moves_from_file = [
+					row for row in csv.reader(filehandle, delimiter=',', quotechar='"')
+					if row
+				]
+			if len(moves_from_file) % 2 == 0:
+				raise NotOddError("For a fair game, there must be an odd number of moves.")
+			if len(moves_from_file) < 3:
+				raise InsufficientMovesError("Multiple moves are necessary.")
 		except UnicodeDecodeError as error:
 			print("That is not a valid CSV file.")
 			exit()
@@ -225,23 +245,51 @@ class Game:
 			self.move_objs.append(new)
 
 		self.complete_initialisation(move_names)
-		print("Starting game with rules from {}.".format(filename))
+		print(f"Starting game with rules from {filename}.")
 
 	def complete_initialisation(self, move_names):
 		# Keep score
 		self.score = Score()
 		self.rounds = 0
 
+		self.n_moves = len(self.move_objs)
+
 		# Outside of this class, we'll need this list of moves stringified.
 		self.move_names = ", ".join(move_names)
 
-		# Build a string with game rules.
-		self.rules = "\nVersion {}\n".format(__version__)
-		self.rules += "Rules of the game:\n"
+		# Map every abbreviation of every move to its Move object.
+		# Abbreviations shared by several moves mean the first of them.
+		self.move_lookup = dict()
 		for obj in self.move_objs:
-			for loser, verb in obj.beats.items():
-				self.rules += (" ".join((obj.move, verb, loser)) + ".\n")
-		self.rules += "\nMake one of these moves, or use ‘score’, ‘rounds’, ‘help’ or ‘exit’."
+			for k in range(1, len(obj._cf) + 1):
+				self.move_lookup.setdefault(obj._cf[:k], obj)
+		# A move's full name is never ambiguous.
+		for obj in self.move_objs:
+			self.move_lookup[obj._cf] = obj
+		# Admin commands are looked up before moves.
+		self.command_lookup = {
+			word: getattr(AdminMove, handler)
+			for word, handler in AdminMove.commands.items()
+		}
+
+		# Build a string with game rules, unless an identical game already has.
+		signature = tuple(
+			(obj.move, tuple(obj.beats.items())) for obj in self.move_objs
+		)
+		self.rules = _rules_cache.get(signature)
+		if self.rules is None:
+			lines = [f"Version {__version__}", "Rules of the game:"]
+			lines += [
+				f"{obj.move} {verb} {loser}."
+				for obj in self.move_objs
+				for loser, verb in obj.beats.items()
+			]
+			lines += ["", "Make one of these moves, or use ‘score’, ‘rounds’, ‘help’ or ‘exit’."]
+			self.rules = _rules_cache[signature] = "\n" + "\n".join(lines)
+
+	def pick_ai_move(self):
+		"Choose a move at random, by index, as the list never changes size."
+		return self.move_objs[random.randrange(self.n_moves)]
 
 
 class DefaultGame(Game):